@@ -74,10 +74,12 @@ The system will automatically compute both methods:
 | **P from T** | Larson–Miller Parameter derived from temperature spline |
 | **Life from T (hours, max 200000)** | Predicted remaining life (capped at 200,000 hours) |
 | **Life from T (years)** | Remaining life converted to years |
+| **T out of digitized range** | True if the temperature, or the stress it maps to, lies outside the digitized curves (values are extrapolated) |
 | **Input Stress (ksi)** | Actual stress values from file |
 | **P from Stress** | Parameter from stress spline |
 | **Life from Stress (hours, max 200000)** | Remaining life prediction from stress |
 | **Life from Stress (years)** | Converted lifetime in years |
+| **Stress out of digitized range** | True if the stress lies outside the digitized Stress → P curve (values are extrapolated) |
 
 ---
 
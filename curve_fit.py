@@ -0,0 +1,331 @@
+"""
+Curve-fit ingestion tool for the digitized Larson–Miller curves.
+
+The material pages (Mean 1/2, Minimal 1/2) carry two hand-digitized curves each:
+    x2 / y2 : Temperature (°F) → Stress (ksi)
+    x1 / y1 : P (Larson–Miller)  vs  Stress (ksi)  (used as Stress → P)
+
+This tool reads those raw points, cleans them (drops NaN, sorts, merges
+near-duplicate x values), fits a monotone PCHIP interpolant, records the
+valid domain and writes the compiled piecewise-polynomial coefficients to a
+single binary file (curves.npz) that loads without refitting.
+
+Usage:
+    python curve_fit.py                  # build curves.npz from the pages
+    python curve_fit.py -o other.npz     # custom output path
+    python curve_fit.py --check          # validate curves.npz (exit 1 on failure)
+"""
+
+import argparse
+import ast
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from scipy.interpolate import PchipInterpolator, PPoly
+
+ROOT = Path(__file__).resolve().parent
+PAGES_DIR = ROOT / "pages"
+DEFAULT_OUTPUT = ROOT / "curves.npz"
+
+MATERIAL_PAGES = ["Mean 1", "Mean 2", "Minimal 1", "Minimal 2"]
+
+# curve name → (x array, y array) as named in the page source
+CURVES = {
+    "t_to_stress": ("x2", "y2"),
+    "stress_to_p": ("y1", "x1"),
+}
+
+
+# === CLEANING ===
+def clean_points(x, y, rel_tol=1e-3):
+    """Drop non-finite points, sort by x and merge near-duplicate x values.
+
+    Points whose x lies within ``rel_tol * (max(x) - min(x))`` of the start of
+    a group are averaged into one point. Returns (x, y) strictly increasing in x.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.shape != y.shape or x.ndim != 1:
+        raise ValueError("x and y must be 1-D arrays of the same length")
+
+    keep = np.isfinite(x) & np.isfinite(y)
+    x, y = x[keep], y[keep]
+
+    order = np.argsort(x, kind="stable")
+    x, y = x[order], y[order]
+    if len(x) < 2:
+        raise ValueError("need at least 2 finite points to fit a curve")
+
+    tol = rel_tol * (x[-1] - x[0])
+    group = np.zeros(len(x), dtype=int)
+    start = x[0]
+    for i in range(1, len(x)):
+        if x[i] - start > tol:
+            start = x[i]
+            group[i] = group[i - 1] + 1
+        else:
+            group[i] = group[i - 1]
+
+    counts = np.bincount(group)
+    x_clean = np.bincount(group, weights=x) / counts
+    y_clean = np.bincount(group, weights=y) / counts
+    if len(x_clean) < 2:
+        raise ValueError("fewer than 2 distinct x values after merging duplicates")
+    return x_clean, y_clean
+
+
+# === MODEL ===
+class CurveModel:
+    """Compiled piecewise polynomial with a recorded valid domain."""
+
+    def __init__(self, breaks, coeffs):
+        self.breaks = np.asarray(breaks, dtype=float)
+        self.coeffs = np.asarray(coeffs, dtype=float)
+        self.domain = (float(self.breaks[0]), float(self.breaks[-1]))
+        self._poly = PPoly.construct_fast(self.coeffs, self.breaks, extrapolate=False)
+
+    @classmethod
+    def fit(cls, x, y, rel_tol=1e-3):
+        """Clean the raw points and fit a monotone (PCHIP) interpolant."""
+        x, y = clean_points(x, y, rel_tol=rel_tol)
+        pchip = PchipInterpolator(x, y, extrapolate=False)
+        return cls(pchip.x, pchip.c)
+
+    def outside(self, values):
+        """Boolean mask of values outside the valid domain (NaN counts as outside)."""
+        values = np.asarray(values, dtype=float)
+        lo, hi = self.domain
+        return ~((values >= lo) & (values <= hi))
+
+    def evaluate(self, values, on_outside="nan"):
+        """Evaluate in bulk without extrapolating.
+
+        Returns (result, outside) where ``outside`` flags inputs beyond the
+        domain; those entries are NaN in ``result``. With ``on_outside="raise"``
+        a ValueError is raised instead.
+        """
+        if on_outside not in ("nan", "raise"):
+            raise ValueError("on_outside must be 'nan' or 'raise'")
+        values = np.asarray(values, dtype=float)
+        outside = self.outside(values)
+        if on_outside == "raise" and outside.any():
+            lo, hi = self.domain
+            raise ValueError(
+                f"{int(outside.sum())} value(s) outside valid domain [{lo:.4f}, {hi:.4f}]"
+            )
+        result = self._poly(values)
+        result[outside] = np.nan
+        return result, outside
+
+    def __call__(self, values):
+        return self.evaluate(values)[0]
+
+
+# === INGESTION ===
+def read_page_points(page_path):
+    """Extract the literal x1/y1/x2/y2 arrays from a material page's source."""
+    tree = ast.parse(Path(page_path).read_text(encoding="utf-8"))
+    points = {}
+    for node in tree.body:
+        if not (isinstance(node, ast.Assign) and len(node.targets) == 1):
+            continue
+        target = node.targets[0]
+        if not (isinstance(target, ast.Name) and target.id in ("x1", "y1", "x2", "y2")):
+            continue
+        value = node.value
+        if isinstance(value, ast.Call) and value.args:
+            value = value.args[0]
+        points[target.id] = np.array(ast.literal_eval(value), dtype=float)
+
+    missing = {"x1", "y1", "x2", "y2"} - points.keys()
+    if missing:
+        raise ValueError(f"{page_path}: missing arrays {sorted(missing)}")
+    return points
+
+
+def model_key(page, curve):
+    return f"{page.lower().replace(' ', '_')}.{curve}"
+
+
+def iter_curves(pages_dir=PAGES_DIR):
+    """Yield (key, raw x, raw y, page CubicSpline) for every curve of every material page."""
+    from larson_miller import build_splines
+
+    for page in MATERIAL_PAGES:
+        points = read_page_points(Path(pages_dir) / f"{page}.py")
+        # build_splines() returns the splines in CURVES order
+        splines = build_splines(points["x1"], points["y1"], points["x2"], points["y2"])
+        for (curve, (x_name, y_name)), spline in zip(CURVES.items(), splines):
+            yield model_key(page, curve), points[x_name], points[y_name], spline
+
+
+def build_models(pages_dir=PAGES_DIR, rel_tol=1e-3):
+    """Fit every curve of every material page. Returns {key: CurveModel}."""
+    return {key: CurveModel.fit(x, y, rel_tol=rel_tol)
+            for key, x, y, _ in iter_curves(pages_dir)}
+
+
+def flag_outside(models, page, T_vals, Stress_from_T, Stress_vals):
+    """Out-of-domain flags for a material page's two life paths.
+
+    Returns (T_outside, S_outside): a temperature row is flagged when it lies
+    outside the T → Stress curve or its stress falls outside the Stress → P
+    curve; a stress row when it lies outside the Stress → P curve.
+    """
+    T_model = models[model_key(page, "t_to_stress")]
+    S_model = models[model_key(page, "stress_to_p")]
+    T_outside = T_model.outside(T_vals) | S_model.outside(Stress_from_T)
+    S_outside = S_model.outside(Stress_vals)
+    return T_outside, S_outside
+
+
+# === SERIALIZATION ===
+def save_models(models, path=DEFAULT_OUTPUT):
+    arrays = {}
+    for key, model in models.items():
+        arrays[f"{key}.breaks"] = model.breaks
+        arrays[f"{key}.coeffs"] = model.coeffs
+    np.savez(path, **arrays)
+
+
+def load_models(path=DEFAULT_OUTPUT):
+    """Load compiled curves written by save_models(). Returns {key: CurveModel}."""
+    with np.load(path) as data:
+        keys = sorted({name.rsplit(".", 1)[0] for name in data.files})
+        return {k: CurveModel(data[f"{k}.breaks"], data[f"{k}.coeffs"]) for k in keys}
+
+
+# === VALIDATION ===
+MONOTONE_SAMPLES = 2001
+BREAKPOINT_RTOL = 1e-9
+
+
+def curve_report(models, pages_dir=PAGES_DIR, rel_tol=1e-3):
+    """Per-curve fit statistics against the page's raw points and CubicSpline.
+
+    Returns {key: dict(points, monotone, breakpoint_dev, spline_dev)}:
+    monotone        - sampled values never change direction over the domain
+    breakpoint_dev  - max relative miss of the cleaned input points
+    spline_dev      - max relative difference from the page's CubicSpline
+    """
+    report = {}
+    for key, x, y, spline in iter_curves(pages_dir):
+        model = models[key]
+        x_clean, y_clean = clean_points(x, y, rel_tol=rel_tol)
+        grid = np.linspace(*model.domain, MONOTONE_SAMPLES)
+        values = model(grid)
+        step = np.diff(values) * np.sign(y_clean[-1] - y_clean[0])
+        scale = np.max(np.abs(y_clean))
+        report[key] = {
+            "points": len(x_clean),
+            "monotone": bool(np.all(step >= -BREAKPOINT_RTOL * scale)),
+            "breakpoint_dev": float(np.max(np.abs(model(x_clean) - y_clean)) / scale),
+            "spline_dev": float(np.max(np.abs(values - spline(grid)) / np.abs(spline(grid)))),
+        }
+    return report
+
+
+def self_test():
+    """Check clean_points(), evaluate() and the save/load round trip. Returns failures."""
+    failures = []
+
+    x, y = clean_points([3.0, 1.0, 1.0 + 1e-7, np.nan, 2.0], [30.0, 10.0, 12.0, 5.0, 20.0])
+    if not (np.allclose(x, [1.0 + 5e-8, 2.0, 3.0]) and np.allclose(y, [11.0, 20.0, 30.0])):
+        failures.append(f"clean_points: merge/sort/NaN drop gave x={x}, y={y}")
+    # one finite point left; two points merged into one
+    for bad_x, bad_tol in (([1.0, np.nan], 1e-3), ([1.0, 2.0], 1.0)):
+        try:
+            clean_points(bad_x, [1.0, 2.0], rel_tol=bad_tol)
+            failures.append(f"clean_points: no ValueError for x={bad_x}, rel_tol={bad_tol}")
+        except ValueError:
+            pass
+
+    model = CurveModel.fit([0.0, 1.0, 2.0], [0.0, 1.0, 4.0])
+    result, outside = model.evaluate([-1.0, 0.5, 3.0, np.nan])
+    if not (np.array_equal(outside, [True, False, True, True])
+            and np.isnan(result[outside]).all() and np.isfinite(result[~outside]).all()):
+        failures.append(f"evaluate: NaN path gave result={result}, outside={outside}")
+    try:
+        model.evaluate([3.0], on_outside="raise")
+        failures.append("evaluate: no ValueError with on_outside='raise'")
+    except ValueError:
+        pass
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "roundtrip.npz"
+        save_models({"a.curve": model}, path)
+        loaded = load_models(path)
+    if (list(loaded) != ["a.curve"] or not np.array_equal(loaded["a.curve"].breaks, model.breaks)
+            or not np.array_equal(loaded["a.curve"].coeffs, model.coeffs)):
+        failures.append("save_models/load_models: round trip changed the model")
+    return failures
+
+
+def check_models(path=DEFAULT_OUTPUT, pages_dir=PAGES_DIR, rel_tol=1e-3):
+    """Check a compiled curves file against a fresh build from the pages. Returns failures."""
+    failures = []
+    built = build_models(pages_dir, rel_tol=rel_tol)
+    try:
+        saved = load_models(path)
+    except OSError as e:
+        return [f"{path}: cannot load ({e})"]
+
+    if sorted(saved) != sorted(built):
+        failures.append(f"{path}: curves {sorted(saved)} != pages {sorted(built)}")
+    for key in sorted(set(saved) & set(built)):
+        if not (np.array_equal(saved[key].breaks, built[key].breaks)
+                and np.array_equal(saved[key].coeffs, built[key].coeffs)):
+            failures.append(f"{key}: {path} is stale, rerun curve_fit.py")
+    return failures
+
+
+def print_report(report):
+    for key, r in report.items():
+        print(f"{key:28s} {r['points']:3d} pts   monotone {str(r['monotone']):5s}   "
+              f"breakpoint dev {r['breakpoint_dev']:.1e}   vs page CubicSpline {r['spline_dev']:6.2%}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-o", "--output", default=str(DEFAULT_OUTPUT),
+                        help="output .npz file (default: curves.npz)")
+    parser.add_argument("--pages-dir", default=str(PAGES_DIR),
+                        help="directory holding the material pages")
+    parser.add_argument("--rel-tol", type=float, default=1e-3,
+                        help="merge x values closer than rel_tol × x-span (default 1e-3)")
+    parser.add_argument("--check", action="store_true",
+                        help="validate the output file against the pages instead of writing it")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        failures = self_test() + check_models(args.output, args.pages_dir, args.rel_tol)
+        models = load_models(args.output) if not failures else build_models(args.pages_dir, args.rel_tol)
+        report = curve_report(models, args.pages_dir, args.rel_tol)
+        print_report(report)
+        for key, r in report.items():
+            if not r["monotone"]:
+                failures.append(f"{key}: not monotone over its domain")
+            if r["breakpoint_dev"] > BREAKPOINT_RTOL:
+                failures.append(f"{key}: misses input points by {r['breakpoint_dev']:.1e}")
+        if failures:
+            print(f"❌ {len(failures)} check(s) failed:")
+            for f in failures:
+                print("  - " + f)
+            return 1
+        print(f"✅ {args.output} matches the pages and all curves validate.")
+        return 0
+
+    models = build_models(args.pages_dir, rel_tol=args.rel_tol)
+    save_models(models, args.output)
+
+    for key, model in models.items():
+        lo, hi = model.domain
+        print(f"{key:28s} {len(model.breaks):3d} pts   domain [{lo:10.4f}, {hi:10.4f}]")
+    print_report(curve_report(models, args.pages_dir, args.rel_tol))
+    print(f"✅ Saved {len(models)} curves to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,495 @@
+"""
+Golden-output regression harness for the Larson–Miller calculations.
+
+Reference = the shared formulas in larson_miller.py that the pages call:
+    - oxide temperature  (Temperature Option A / B)
+    - Temperature → Stress → P → Life  and  Stress → P → Life
+      (CubicSpline chain in Mean 1/2, Minimal 1/2, fitted to each page's points)
+
+Alternative engines plug in as an EVALUATORS dict of Evaluator entries in
+their own module. Each is run against the reference on the frozen golden
+inputs and on fresh random inputs, and the maximum deviation and the speedup
+over the reference are reported. golden_fixtures.py holds stand-in
+evaluators that only self-test the harness; they are not optimizations.
+
+In-domain inputs stay inside each page's digitized curves, built fresh from the
+pages with curve_fit.build_models() (a stale curves.npz fails the run):
+the temperature range is the part of the Temperature → Stress curve whose
+stress stays inside the Stress → P curve. A separate out-of-domain set holds
+inputs just outside those ranges. There the pages extrapolate; evaluators
+that mirror the pages must reproduce the extrapolated values, while
+domain-aware evaluators must return NaN exactly at flagged inputs.
+
+Usage:
+    python golden.py --freeze             # write golden.npz from today's reference
+    python golden.py                      # check the reference against golden.npz
+    python golden.py --plugin my_engine   # also check my_engine.EVALUATORS (exit 1 on failure)
+    python golden.py --self-test          # prove the harness accepts/rejects golden_fixtures
+    python golden.py --plugin my_engine --rounds 20 --seed 7 --size 200000
+"""
+
+import argparse
+import importlib
+import time
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from curve_fit import MATERIAL_PAGES, PAGES_DIR, build_models, check_models, model_key, read_page_points
+from larson_miller import (
+    LIFE_CAP_HOURS,
+    build_splines,
+    life_from_stress,
+    life_from_temperature,
+    oxide_temperature,
+)
+
+ROOT = Path(__file__).resolve().parent
+GOLDEN_FILE = ROOT / "golden.npz"
+
+# Input ranges used for golden and random inputs
+OXIDE_MM = (0.05, 1.5)
+EXPOSURE_YEARS = (0.5, 30.0)
+T_REF_F = (900.0, 1050.0)
+
+# Out-of-domain inputs lie this far past a domain end, as a fraction of its span
+OUTSIDE_MARGIN = (0.001, 0.05)
+
+# life output → the input whose domain it depends on
+LIFE_MASKS = {
+    "P_from_T": "T_outside",
+    "life_T_hours": "T_outside",
+    "P_from_S": "S_outside",
+    "life_S_hours": "S_outside",
+}
+
+
+# === REFERENCE (the functions the pages call) ===
+reference_temperature = oxide_temperature
+
+
+@lru_cache(maxsize=None)
+def page_points(page):
+    """The page's digitized points, parsed once so file I/O stays out of the timings."""
+    return read_page_points(PAGES_DIR / f"{page}.py")
+
+
+def reference_splines(page):
+    """The page's digitized points through the same build_splines() the page calls."""
+    pts = page_points(page)
+    return build_splines(pts["x1"], pts["y1"], pts["x2"], pts["y2"])
+
+
+def reference_life(page, stress, temp_f, t_ref_f):
+    """Both life paths of a material page. Splines are rebuilt per call, as each page rerun does."""
+    cs_TtoStress, cs_StressToP = reference_splines(page)
+    _, P_from_T, life_T = life_from_temperature(cs_TtoStress, cs_StressToP, temp_f)
+    P_from_S, life_S = life_from_stress(cs_StressToP, stress, t_ref_f)
+    return {
+        "P_from_T": P_from_T,
+        "life_T_hours": life_T,
+        "P_from_S": P_from_S,
+        "life_S_hours": life_S,
+    }
+
+
+# === DOMAINS ===
+@lru_cache(maxsize=None)
+def curve_models():
+    """Curve domains built from the current page points, never from a possibly stale curves.npz."""
+    return build_models()
+
+
+@lru_cache(maxsize=None)
+def stress_range(page):
+    """Digitized stress domain of the Stress → P curve."""
+    return curve_models()[model_key(page, "stress_to_p")].domain
+
+
+@lru_cache(maxsize=None)
+def temperature_range(page, samples=20001):
+    """Temperatures inside the T → Stress domain whose stress stays inside the Stress → P domain."""
+    t_lo, t_hi = curve_models()[model_key(page, "t_to_stress")].domain
+    s_lo, s_hi = stress_range(page)
+    cs_TtoStress, _ = reference_splines(page)
+    t = np.linspace(t_lo, t_hi, samples)
+    stress = cs_TtoStress(t)
+    inside = np.flatnonzero((stress >= s_lo) & (stress <= s_hi))
+    if len(inside) == 0 or inside[-1] - inside[0] + 1 != len(inside):
+        raise ValueError(f"{page}: stress from temperature does not stay in one in-domain interval")
+    return float(t[inside[0]]), float(t[inside[-1]])
+
+
+def domain_masks(page, stress, temp_f):
+    """Flags for inputs outside the page's temperature / stress ranges."""
+    t_lo, t_hi = temperature_range(page)
+    s_lo, s_hi = stress_range(page)
+    return {
+        "T_outside": ~((temp_f >= t_lo) & (temp_f <= t_hi)),
+        "S_outside": ~((stress >= s_lo) & (stress <= s_hi)),
+    }
+
+
+# === EVALUATOR REGISTRY ===
+# temperature(x_mm, t_years) → T (°R), or None if the engine has no temperature path
+# life(page, stress, temp_f, t_ref_f) → dict of LIFE_MASKS keys, or None
+# rtol: allowed max relative deviation from the reference
+# nan_outside: True if the engine returns NaN for out-of-domain inputs
+Evaluator = namedtuple("Evaluator", ["temperature", "life", "rtol", "nan_outside"])
+
+# Filled from --plugin modules (each exports its own EVALUATORS dict)
+EVALUATORS = {}
+
+# Frozen golden data must reproduce to this relative tolerance
+GOLDEN_RTOL = 1e-12
+
+
+# === INPUTS ===
+def random_inputs(rng, size):
+    inputs = {
+        "x_mm": rng.uniform(*OXIDE_MM, size),
+        "t_years": rng.uniform(*EXPOSURE_YEARS, size),
+    }
+    for page in MATERIAL_PAGES:
+        key = model_key(page, "")
+        inputs[key + "stress"] = rng.uniform(*stress_range(page), size)
+        inputs[key + "temp_f"] = rng.uniform(*temperature_range(page), size)
+        inputs[key + "t_ref_f"] = rng.uniform(*T_REF_F, size)
+    return inputs
+
+
+def _around(rng, lo, hi, size):
+    """Half the values just below lo or just above hi, half inside [lo, hi]."""
+    span = hi - lo
+    offset = rng.uniform(*OUTSIDE_MARGIN, size) * span
+    outside = np.where(rng.random(size) < 0.5, lo - offset, hi + offset)
+    return np.where(rng.random(size) < 0.5, outside, rng.uniform(lo, hi, size))
+
+
+def out_of_domain_inputs(rng, size):
+    """Life inputs straddling each page's domain ends (no oxide inputs)."""
+    inputs = {}
+    for page in MATERIAL_PAGES:
+        key = model_key(page, "")
+        inputs[key + "stress"] = _around(rng, *stress_range(page), size)
+        inputs[key + "temp_f"] = _around(rng, *temperature_range(page), size)
+        inputs[key + "t_ref_f"] = rng.uniform(*T_REF_F, size)
+    return inputs
+
+
+def golden_inputs():
+    """Fixed grid end points plus a seeded random sample."""
+    inputs = random_inputs(np.random.default_rng(2024), 500)
+    grid = np.linspace(0.0, 1.0, 21)
+    inputs["x_mm"] = np.concatenate([OXIDE_MM[0] + grid * (OXIDE_MM[1] - OXIDE_MM[0]), inputs["x_mm"]])
+    inputs["t_years"] = np.concatenate([np.full(21, 10.0), inputs["t_years"]])
+    for page in MATERIAL_PAGES:
+        key = model_key(page, "")
+        s_lo, s_hi = stress_range(page)
+        t_lo, t_hi = temperature_range(page)
+        inputs[key + "stress"] = np.concatenate([s_lo + grid * (s_hi - s_lo), inputs[key + "stress"]])
+        inputs[key + "temp_f"] = np.concatenate([t_lo + grid * (t_hi - t_lo), inputs[key + "temp_f"]])
+        inputs[key + "t_ref_f"] = np.concatenate([np.full(21, 950.0), inputs[key + "t_ref_f"]])
+    return inputs
+
+
+def golden_out_of_domain_inputs():
+    return out_of_domain_inputs(np.random.default_rng(2025), 200)
+
+
+def page_args(inputs, page):
+    key = model_key(page, "")
+    return inputs[key + "stress"], inputs[key + "temp_f"], inputs[key + "t_ref_f"]
+
+
+def compute_life_outputs(inputs, life=reference_life):
+    outputs = {}
+    if life is None:
+        return outputs
+    with np.errstate(over="ignore"):  # extrapolated P can overflow 10**x before the cap
+        for page in MATERIAL_PAGES:
+            key = model_key(page, "")
+            for name, values in life(page, *page_args(inputs, page)).items():
+                outputs[key + name] = values
+    return outputs
+
+
+def compute_outputs(inputs, temperature=reference_temperature, life=reference_life):
+    outputs = {}
+    if temperature is not None:
+        outputs["T_rankine"] = temperature(inputs["x_mm"], inputs["t_years"])
+    outputs.update(compute_life_outputs(inputs, life))
+    return outputs
+
+
+def covered(expected, evaluator):
+    """The part of the expected outputs an evaluator implements."""
+    return {k: v for k, v in expected.items()
+            if (evaluator.temperature if k == "T_rankine" else evaluator.life) is not None}
+
+
+def compute_masks(inputs):
+    """Per-output flags of out-of-domain entries, keyed like the life outputs."""
+    masks = {}
+    for page in MATERIAL_PAGES:
+        key = model_key(page, "")
+        stress, temp_f, _ = page_args(inputs, page)
+        page_masks = domain_masks(page, stress, temp_f)
+        for name, mask_name in LIFE_MASKS.items():
+            masks[key + name] = page_masks[mask_name]
+    return masks
+
+
+# === COMPARISON ===
+def max_rel_deviation(actual, expected):
+    actual = np.asarray(actual, dtype=float)
+    expected = np.asarray(expected, dtype=float)
+    if actual.shape != expected.shape:
+        return np.inf
+    if actual.size == 0:
+        return 0.0
+    return float(np.max(np.abs(actual - expected) / np.maximum(np.abs(expected), 1e-300)))
+
+
+def check_properties(outputs):
+    """Physical sanity checks that must hold for any evaluator on in-domain inputs."""
+    problems = []
+    for key, values in outputs.items():
+        if not np.all(np.isfinite(values)):
+            problems.append(f"{key}: non-finite values")
+        if key.endswith("_hours") and (np.any(values <= 0) or np.any(values > LIFE_CAP_HOURS)):
+            problems.append(f"{key}: life outside (0, {LIFE_CAP_HOURS}]")
+    return problems
+
+
+def compare(outputs, expected, rtol):
+    """Returns (worst deviation, failures) over all output arrays."""
+    worst, failures = 0.0, []
+    for key, ref in expected.items():
+        dev = max_rel_deviation(outputs.get(key, np.array([])), ref)
+        worst = max(worst, dev)
+        if not dev <= rtol:
+            failures.append(f"{key}: max rel deviation {dev:.3e} > {rtol:.0e}")
+    return worst, failures + check_properties(outputs)
+
+
+def compare_out_of_domain(outputs, expected, masks, rtol, nan_outside):
+    """Like compare(), split by the out-of-domain mask.
+
+    In-domain entries must match the reference and pass the properties.
+    Flagged entries must be NaN (nan_outside) or match the reference's
+    extrapolated values.
+    """
+    worst, failures = 0.0, []
+    for key, ref in expected.items():
+        actual = outputs.get(key, np.full_like(ref, np.inf))
+        outside = masks[key]
+        dev = max_rel_deviation(actual[~outside], ref[~outside])
+        failures += check_properties({key: actual[~outside]})
+        if nan_outside:
+            if not np.all(np.isnan(actual[outside])):
+                failures.append(f"{key}: {int(np.sum(~np.isnan(actual[outside])))} "
+                                f"out-of-domain value(s) not NaN")
+        else:
+            dev = max(dev, max_rel_deviation(actual[outside], ref[outside]))
+        worst = max(worst, dev)
+        if not dev <= rtol:
+            failures.append(f"{key}: max rel deviation {dev:.3e} > {rtol:.0e}")
+    return worst, failures
+
+
+def timed(fn, *args, repeat=3):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# === COMMANDS ===
+def freeze(path=GOLDEN_FILE):
+    stale = check_models()
+    if stale:
+        raise ValueError("curves.npz does not match the pages: " + "; ".join(stale))
+    inputs = golden_inputs()
+    outputs = compute_outputs(inputs)
+    problems = check_properties(outputs)
+    if problems:
+        raise ValueError("reference violates properties: " + "; ".join(problems))
+    ood_inputs = golden_out_of_domain_inputs()
+    ood_outputs = compute_life_outputs(ood_inputs)
+    ood_masks = compute_masks(ood_inputs)
+    np.savez(path, **{"in." + k: v for k, v in inputs.items()},
+             **{"out." + k: v for k, v in outputs.items()},
+             **{"ood.in." + k: v for k, v in ood_inputs.items()},
+             **{"ood.out." + k: v for k, v in ood_outputs.items()},
+             **{"ood.mask." + k: v for k, v in ood_masks.items()})
+    flagged = sum(int(m.sum()) for m in ood_masks.values())
+    print(f"✅ Froze {len(outputs)} in-domain and {len(ood_outputs)} out-of-domain output arrays "
+          f"({flagged} flagged values) to {path}")
+
+
+def load_golden(path=GOLDEN_FILE):
+    """Returns (inputs, outputs, ood_inputs, ood_outputs, ood_masks)."""
+    def section(data, prefix):
+        return {k[len(prefix):]: data[k] for k in data.files if k.startswith(prefix)}
+
+    with np.load(path) as data:
+        return (section(data, "in."), section(data, "out."), section(data, "ood.in."),
+                section(data, "ood.out."), section(data, "ood.mask."))
+
+
+def check_reference(golden):
+    """Today's reference must still reproduce the frozen outputs and masks. Returns failures."""
+    inputs, expected, ood_inputs, ood_expected, ood_masks = golden
+    failures = []
+    worst, fails = compare(compute_outputs(inputs), expected, GOLDEN_RTOL)
+    failures += ["reference/golden " + f for f in fails]
+    ood_worst, fails = compare_out_of_domain(
+        compute_life_outputs(ood_inputs), ood_expected, ood_masks, GOLDEN_RTOL, nan_outside=False)
+    failures += ["reference/out-of-domain " + f for f in fails]
+    for key, mask in compute_masks(ood_inputs).items():
+        if not np.array_equal(mask, ood_masks[key]):
+            failures.append(f"reference/out-of-domain {key}: domain mask changed")
+    print(f"{'reference':20s} golden max rel dev {worst:.3e}   out-of-domain max rel dev {ood_worst:.3e}")
+    return failures
+
+
+def random_cases(rounds, seed, size):
+    """Random in-domain and out-of-domain sets with their reference outputs, computed once."""
+    rng = np.random.default_rng(seed)
+    cases = []
+    for _ in range(rounds):
+        rand = random_inputs(rng, size)
+        rand_ood = out_of_domain_inputs(rng, size)
+        cases.append((rand, compute_outputs(rand),
+                      rand_ood, compute_life_outputs(rand_ood), compute_masks(rand_ood)))
+    return cases
+
+
+def check_evaluator(name, evaluator, golden, cases):
+    """Golden and random checks of one evaluator. Returns (deviations, failures)."""
+    temperature, life, rtol, nan_outside = evaluator
+    inputs, expected, ood_inputs, ood_expected, ood_masks = golden
+    failures = []
+
+    # --- Golden inputs, in and out of domain ---
+    golden_dev, fails = compare(compute_outputs(inputs, temperature, life),
+                                covered(expected, evaluator), rtol)
+    failures += [f"{name}/golden " + f for f in fails]
+    ood_dev = 0.0
+    if life is not None:
+        ood_dev, fails = compare_out_of_domain(
+            compute_life_outputs(ood_inputs, life), ood_expected, ood_masks, rtol, nan_outside)
+        failures += [f"{name}/out-of-domain " + f for f in fails]
+
+    # --- Property-based: random inputs vs reference ---
+    random_dev = 0.0
+    for i, (rand, rand_ref, rand_ood, rand_ood_ref, rand_masks) in enumerate(cases):
+        dev, fails = compare(compute_outputs(rand, temperature, life), covered(rand_ref, evaluator), rtol)
+        random_dev = max(random_dev, dev)
+        failures += [f"{name}/random[{i}] " + f for f in fails]
+        if life is not None:
+            dev, fails = compare_out_of_domain(
+                compute_life_outputs(rand_ood, life), rand_ood_ref, rand_masks, rtol, nan_outside)
+            ood_dev = max(ood_dev, dev)
+            failures += [f"{name}/random-out-of-domain[{i}] " + f for f in fails]
+
+    return (golden_dev, random_dev, ood_dev), failures
+
+
+def speedup(evaluator, bench):
+    """Reference time / evaluator time on the same outputs of a large batch."""
+    reference = (reference_temperature if evaluator.temperature else None,
+                 reference_life if evaluator.life else None)
+    return (timed(compute_outputs, bench, *reference)
+            / timed(compute_outputs, bench, evaluator.temperature, evaluator.life))
+
+
+def run_checks(evaluators, path=GOLDEN_FILE, rounds=10, seed=0, size=5000, bench_size=200000):
+    # --- 0. The app's compiled curves must match the pages ---
+    failures = ["curves.npz " + f for f in check_models()]
+
+    # --- 1. Today's reference must still reproduce the frozen outputs ---
+    golden = load_golden(path)
+    failures += check_reference(golden)
+    if not evaluators:
+        return failures
+
+    # --- 2. Every evaluator against the reference, with its speedup ---
+    cases = random_cases(rounds, seed, size)
+    bench = random_inputs(np.random.default_rng(seed + 1), bench_size)
+    for name, evaluator in evaluators.items():
+        (golden_dev, random_dev, ood_dev), fails = check_evaluator(name, evaluator, golden, cases)
+        failures += fails
+        print(f"{name:20s} golden max rel dev {golden_dev:.3e}   random max rel dev {random_dev:.3e}   "
+              f"out-of-domain max rel dev {ood_dev:.3e}   speedup ×{speedup(evaluator, bench):.2f}")
+    return failures
+
+
+def self_test(path=GOLDEN_FILE, rounds=2, seed=0, size=2000):
+    """Good fixtures must pass, broken fixtures must be rejected. Returns failures."""
+    import golden_fixtures
+
+    golden = load_golden(path)
+    cases = random_cases(rounds, seed, size)
+    failures = []
+    for name, evaluator in golden_fixtures.EVALUATORS.items():
+        (golden_dev, random_dev, ood_dev), fails = check_evaluator(name, evaluator, golden, cases)
+        failures += fails
+        print(f"{name:20s} golden max rel dev {golden_dev:.3e}   random max rel dev {random_dev:.3e}   "
+              f"out-of-domain max rel dev {ood_dev:.3e}   (fixture, not timed)")
+    for name, evaluator in golden_fixtures.BROKEN.items():
+        _, fails = check_evaluator(name, evaluator, golden, cases)
+        print(f"{name:20s} rejected with {len(fails)} failure(s)   (broken fixture)")
+        if not fails:
+            failures.append(f"{name}: broken fixture was not rejected")
+    return failures
+
+
+def load_plugins(names):
+    """Collect the EVALUATORS dicts of the given modules."""
+    evaluators = {}
+    for module_name in names:
+        evaluators.update(importlib.import_module(module_name).EVALUATORS)
+    return evaluators
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--freeze", action="store_true",
+                        help="regenerate the golden file from today's reference")
+    parser.add_argument("--golden", default=str(GOLDEN_FILE), help="golden .npz file")
+    parser.add_argument("--plugin", action="append", default=[],
+                        help="module exporting an EVALUATORS dict to check (repeatable)")
+    parser.add_argument("--self-test", action="store_true",
+                        help="check that the harness accepts/rejects the golden_fixtures evaluators")
+    parser.add_argument("--rounds", type=int, default=10, help="random input rounds")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--size", type=int, default=5000, help="points per random round")
+    parser.add_argument("--bench-size", type=int, default=200000, help="points per page for timing")
+    args = parser.parse_args(argv)
+
+    if args.freeze:
+        freeze(args.golden)
+        return 0
+
+    if args.self_test:
+        failures = self_test(args.golden, seed=args.seed)
+    else:
+        evaluators = dict(EVALUATORS, **load_plugins(args.plugin))
+        failures = run_checks(evaluators, args.golden, args.rounds, args.seed, args.size, args.bench_size)
+    if failures:
+        print(f"❌ {len(failures)} check(s) failed:")
+        for f in failures:
+            print("  - " + f)
+        return 1
+    print("✅ All checks passed.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
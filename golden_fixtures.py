@@ -0,0 +1,132 @@
+"""
+Self-test fixtures for golden.py — NOT optimized engines.
+
+These stand-in evaluators exist only to prove the harness works: the good
+ones must pass every check, the broken ones must be rejected. They are
+not faster than the reference (they share its numpy/scipy kernels), so
+`python golden.py --self-test` does not time them.
+
+Real engines live in their own module exporting an EVALUATORS dict of
+golden.Evaluator entries and are checked with `python golden.py --plugin <module>`.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+from scipy.interpolate import PPoly
+
+from golden import Evaluator, reference_splines, stress_range, temperature_range
+from larson_miller import HOURS_PER_YEAR, MM_TO_MILS, life_hours
+
+
+# === LIFE ===
+@lru_cache(maxsize=None)
+def compiled_splines(page):
+    """Spline coefficients compiled once into PPoly objects (no refit per call)."""
+    return tuple(PPoly.construct_fast(cs.c, cs.x, extrapolate=True)
+                 for cs in reference_splines(page))
+
+
+def _life_outputs(P_from_T, temp_f, P_from_S, t_ref_f):
+    return {
+        "P_from_T": P_from_T,
+        "life_T_hours": life_hours(P_from_T, temp_f),
+        "P_from_S": P_from_S,
+        "life_S_hours": life_hours(P_from_S, t_ref_f),
+    }
+
+
+def vectorized_life(page, stress, temp_f, t_ref_f):
+    pp_TtoStress, pp_StressToP = compiled_splines(page)
+    return _life_outputs(pp_StressToP(pp_TtoStress(temp_f)), temp_f, pp_StressToP(stress), t_ref_f)
+
+
+TABLE_SIZE = 8192
+
+
+@lru_cache(maxsize=None)
+def lookup_tables(page):
+    """Dense (grid, P) tables for Temperature → P and Stress → P over the page's domains."""
+    pp_TtoStress, pp_StressToP = compiled_splines(page)
+    t_grid = np.linspace(*temperature_range(page), TABLE_SIZE)
+    s_grid = np.linspace(*stress_range(page), TABLE_SIZE)
+    return (t_grid, pp_StressToP(pp_TtoStress(t_grid))), (s_grid, pp_StressToP(s_grid))
+
+
+def table_life(page, stress, temp_f, t_ref_f):
+    """Linear interpolation in precomputed tables; NaN for inputs outside the tables."""
+    (t_grid, p_t), (s_grid, p_s) = lookup_tables(page)
+    P_from_T = np.interp(temp_f, t_grid, p_t, left=np.nan, right=np.nan)
+    P_from_S = np.interp(stress, s_grid, p_s, left=np.nan, right=np.nan)
+    return _life_outputs(P_from_T, temp_f, P_from_S, t_ref_f)
+
+
+def clamping_table_life(page, stress, temp_f, t_ref_f):
+    """Broken on purpose: np.interp clamps to the end values outside the tables."""
+    (t_grid, p_t), (s_grid, p_s) = lookup_tables(page)
+    return _life_outputs(np.interp(temp_f, t_grid, p_t), temp_f, np.interp(stress, s_grid, p_s), t_ref_f)
+
+
+CHUNK_SIZE = 16384
+
+
+def _chunks(n):
+    return [slice(i, min(i + CHUNK_SIZE, n)) for i in range(0, n, CHUNK_SIZE)]
+
+
+def _merge(parts):
+    return {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+
+
+def chunked_life(page, stress, temp_f, t_ref_f):
+    parts = [vectorized_life(page, stress[s], temp_f[s], t_ref_f[s]) for s in _chunks(len(stress))]
+    return _merge(parts)
+
+
+def parallel_life(page, stress, temp_f, t_ref_f, workers=4):
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(
+            lambda s: vectorized_life(page, stress[s], temp_f[s], t_ref_f[s]),
+            _chunks(len(stress)),
+        ))
+    return _merge(parts)
+
+
+# === TEMPERATURE ===
+def vectorized_temperature(x_mm, t_years):
+    """Same formula with the unit conversions folded into constants."""
+    logx = np.log10(x_mm) + np.log10(MM_TO_MILS)
+    logt = np.log10(t_years) + np.log10(HOURS_PER_YEAR)
+    return (logx + 7.1438) / (2.1761e-4 * (20 + logt))
+
+
+def chunked_temperature(x_mm, t_years):
+    return np.concatenate([vectorized_temperature(x_mm[s], t_years[s]) for s in _chunks(len(x_mm))])
+
+
+def parallel_temperature(x_mm, t_years, workers=4):
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = pool.map(lambda s: vectorized_temperature(x_mm[s], t_years[s]), _chunks(len(x_mm)))
+        return np.concatenate(list(parts))
+
+
+def shifted_temperature(x_mm, t_years):
+    """Broken on purpose: off by 0.01 °R."""
+    return vectorized_temperature(x_mm, t_years) + 0.01
+
+
+# === FIXTURES ===
+# Must pass every check
+EVALUATORS = {
+    "vectorized": Evaluator(vectorized_temperature, vectorized_life, 1e-12, False),
+    "table": Evaluator(None, table_life, 1e-4, True),
+    "chunked": Evaluator(chunked_temperature, chunked_life, 1e-12, False),
+    "parallel": Evaluator(parallel_temperature, parallel_life, 1e-12, False),
+}
+
+# Must be rejected
+BROKEN = {
+    "clamping-table": Evaluator(None, clamping_table_life, 1e-4, True),
+    "shifted-temperature": Evaluator(shifted_temperature, None, 1e-12, False),
+}
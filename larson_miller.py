@@ -0,0 +1,79 @@
+"""
+Shared Larson–Miller formulas used by the Streamlit pages and golden.py.
+
+Keeping the spline construction and life formulas here means the golden
+harness pins exactly what the app computes.
+"""
+
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+LIFE_CAP_HOURS = 200000
+MM_TO_MILS = 39.3701
+HOURS_PER_YEAR = 365 * 24
+
+
+# === OXIDE TEMPERATURE ===
+def oxide_temperature_steps(x_mm, t_years):
+    """Oxide thickness (mm) and exposure time (years) → T (°R), with every step.
+
+    log x = -7.1438 + 2.1761e-4 · T · (20 + log t), x in mils, t in hours.
+    Returns a dict with x_mils, t_hours, logx, logt, numerator, denominator
+    and T_rankine.
+    """
+    x_mils = np.asarray(x_mm, dtype=float) * MM_TO_MILS     # mm → mils
+    t_hours = np.asarray(t_years, dtype=float) * HOURS_PER_YEAR  # years → hours
+    logx = np.log10(x_mils)
+    logt = np.log10(t_hours)
+    numerator = logx + 7.1438
+    denominator = 2.1761e-4 * (20 + logt)
+    return {
+        "x_mils": x_mils,
+        "t_hours": t_hours,
+        "logx": logx,
+        "logt": logt,
+        "numerator": numerator,
+        "denominator": denominator,
+        "T_rankine": numerator / denominator,
+    }
+
+
+def oxide_temperature(x_mm, t_years):
+    """Oxide thickness (mm) and exposure time (years) → T (°R)."""
+    return oxide_temperature_steps(x_mm, t_years)["T_rankine"]
+
+
+# === SPLINES ===
+def build_splines(x1, y1, x2, y2):
+    """Build (cs_TtoStress, cs_StressToP) from a material page's digitized points.
+
+    x2 / y2 : Temperature (°F) → Stress (ksi)
+    x1 / y1 : P vs Stress (ksi), fitted as Stress → P
+    Points are sorted so the digitizing order does not matter.
+    """
+    sort_idx = np.argsort(x2)
+    cs_TtoStress = CubicSpline(x2[sort_idx], y2[sort_idx], extrapolate=True)
+    sort_idx2 = np.argsort(y1)
+    cs_StressToP = CubicSpline(y1[sort_idx2], x1[sort_idx2], extrapolate=True)
+    return cs_TtoStress, cs_StressToP
+
+
+# === LIFE ===
+def life_hours(P, T_f):
+    """Remaining life (hours, capped at LIFE_CAP_HOURS) from P and temperature (°F)."""
+    T_rankine = T_f + 459.67
+    t_hours = 10 ** ((P * 1000 / T_rankine) - 20)
+    return np.minimum(t_hours, LIFE_CAP_HOURS)
+
+
+def life_from_temperature(cs_TtoStress, cs_StressToP, T_f):
+    """Temperature → Stress → P → Life. Returns (stress, P, life hours)."""
+    stress = cs_TtoStress(T_f)
+    P = cs_StressToP(stress)
+    return stress, P, life_hours(P, T_f)
+
+
+def life_from_stress(cs_StressToP, stress, T_ref_f):
+    """Stress → P → Life at a reference temperature. Returns (P, life hours)."""
+    P = cs_StressToP(stress)
+    return P, life_hours(P, T_ref_f)
@@ -1,7 +1,8 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-from scipy.interpolate import CubicSpline
+from larson_miller import build_splines, life_from_temperature, life_from_stress
+from curve_fit import flag_outside, load_models
 from io import BytesIO
 
 st.title("Larson–Miller Parameter - Minimal 1¼ Cr - 1/2 Mo Steel (Temperature & Stress Comparison)")
@@ -47,20 +48,15 @@ y2 = np.array([
 5.924271539996955,5.424856371263967
 ])
 
-# Sort to ensure strictly increasing temperature
-sort_idx = np.argsort(x2)
-x2_sorted = x2[sort_idx]
-y2_sorted = y2[sort_idx]
-
-cs_TtoStress = CubicSpline(x2_sorted, y2_sorted, extrapolate=True)
-
-
 # === SPLINE 2: Stress → P ===
 x1 = np.array([30.31,30.69,31.07,31.45,31.83,32.12,32.26,32.62,32.94,33.27,33.53,33.80,34.03,34.17,34.46,34.72,34.86,35.16,35.32,35.62,35.87,36.10,36.42,36.74,37.09,37.45,37.83,38.09])
 y1 = np.array([48.61,46.85,44.77,42.43,39.84,37.95,36.65,33.95,31.24,27.81,25.05,21.90,19.72,18.23,16.83,15.52,14.46,13.28,12.24,11.22,9.99,9.29,8.60,7.93,7.27,6.72,5.95,5.74])
-# Sort stress to ensure increasing order
-sort_idx2 = np.argsort(y1)
-cs_StressToP = CubicSpline(y1[sort_idx2], x1[sort_idx2], extrapolate=True)
+
+# === BUILD SPLINES ===
+cs_TtoStress, cs_StressToP = build_splines(x1, y1, x2, y2)
+
+# === DIGITIZED DOMAINS (compiled by curve_fit.py) ===
+curve_models = st.cache_resource(load_models)()
 
 # === PROCESS FILE ===
 if uploaded_file:
@@ -71,38 +67,39 @@ if uploaded_file:
     T_vals = df.iloc[:, 1].dropna().to_numpy()
 
     # === PATH 1: From Temperature ===
-    Stress_from_T = cs_TtoStress(T_vals)
-    P_from_T = cs_StressToP(Stress_from_T)
-
-    T_rankine = T_vals + 459.67
-    t_hours_T = 10 ** ((P_from_T * 1000 / T_rankine) - 20)
-    t_hours_T = np.minimum(t_hours_T, 200000)
+    Stress_from_T, P_from_T, t_hours_T = life_from_temperature(cs_TtoStress, cs_StressToP, T_vals)
     t_years_T = t_hours_T / (24 * 365)
     status_T = np.where(t_years_T >= 5, "SAFE", "REPLACE")
 
     # === PATH 2: From Stress ===
-    P_from_S = cs_StressToP(Stress_vals)
     T_ref = st.number_input(
         "Enter reference temperature (°F) for stress-based life (default 950):",
         min_value=0.0, step=1.0, value=950.0
     )
-    T_ref_R = T_ref + 459.67
-
-    t_hours_S = 10 ** ((P_from_S * 1000 / T_ref_R) - 20)
-    t_hours_S = np.minimum(t_hours_S, 200000)
+    P_from_S, t_hours_S = life_from_stress(cs_StressToP, Stress_vals, T_ref)
     t_years_S = t_hours_S / (24 * 365)
     status_S = np.where(t_years_S >= 5, "SAFE", "REPLACE")
 
+    # === DIGITIZED RANGE CHECK ===
+    T_outside, S_outside = flag_outside(curve_models, "Minimal 1", T_vals, Stress_from_T, Stress_vals)
+    if T_outside.any() or S_outside.any():
+        st.warning(
+            f"⚠️ {int(T_outside.sum())} temperature row(s) and {int(S_outside.sum())} stress row(s) "
+            "are outside the digitized curves; their P and life are extrapolated."
+        )
+
     # === OUTPUT TABLE ===
     df_out = pd.DataFrame({
         "Temperature (°F)": T_vals,
         "P from T": P_from_T,
         "Life from T (hours, max 200000)": t_hours_T,
         "Life from T (years)": t_years_T,
+        "T out of digitized range": T_outside,
         "Input Stress (ksi)": Stress_vals,
         "P from Stress": P_from_S,
         "Life from Stress (hours, max 200000)": t_hours_S,
-        "Life from Stress (years)": t_years_S
+        "Life from Stress (years)": t_years_S,
+        "Stress out of digitized range": S_outside
     })
 
     st.success("✅ Dual calculation completed successfully!")
@@ -1,7 +1,7 @@
 import streamlit as st 
 import pandas as pd
-import numpy as np
 from io import BytesIO
+from larson_miller import MM_TO_MILS, oxide_temperature
 
 st.title("Larson–Miller Calculator: Temperature (T) in Rankine (°R)")
 
@@ -52,14 +52,10 @@ if uploaded_file is not None and t_value > 0:
         st.error("❌ Some values of thickness (x) ≤ 0. Log10 cannot be calculated.")
     else:
         # --- Conversion ---
-        df['x_mils'] = df['x_mm'] * 39.3701      # mm → mils
-        t_hours = t_value * 365 * 24             # years → hours
+        df['x_mils'] = df['x_mm'] * MM_TO_MILS   # mm → mils
 
         # --- Calculation ---
-        logx = np.log10(df['x_mils'])
-        logt = np.log10(t_hours)
-
-        df['T (°R)'] = (logx + 7.1438) / (2.1761e-4 * (20 + logt))
+        df['T (°R)'] = oxide_temperature(df['x_mm'], t_value)
         df['T (°F)'] = df['T (°R)'] - 459.67
         df['T (°C)'] = (df['T (°F)'] - 32) * 5/9
 
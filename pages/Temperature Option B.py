@@ -1,5 +1,5 @@
 import streamlit as st
-import numpy as np
+from larson_miller import oxide_temperature_steps
 
 st.title("Larson–Miller Temperature Calculator")
 
@@ -24,17 +24,16 @@ t_years = st.number_input("Enter exposure time (years):", min_value=0.0, step=0.
 
 # --- Calculation ---
 if x_mm > 0 and t_years > 0:
-    # Convert units
-    x_mils = x_mm * 39.3701     # mm → mils
-    t_hours = t_years * 365 * 24  # years → hours
+    # Convert units and compute (mm → mils, years → hours)
+    steps = oxide_temperature_steps(x_mm, t_years)
+    x_mils = float(steps["x_mils"])
+    t_hours = float(steps["t_hours"])
+    logx = float(steps["logx"])
+    logt = float(steps["logt"])
+    numerator = float(steps["numerator"])
+    denominator = float(steps["denominator"])
 
-    # Compute
-    logx = np.log10(x_mils)
-    logt = np.log10(t_hours)
-    numerator = logx + 7.1438
-    denominator = 2.1761e-4 * (20 + logt)
-
-    T_rankine = numerator / denominator
+    T_rankine = float(steps["T_rankine"])
     T_fahrenheit = T_rankine - 459.67
     T_celsius = (T_fahrenheit - 32) * 5 / 9
 